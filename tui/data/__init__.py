@@ -1,4 +1,8 @@
 """TUI Data"""
-from .options import OPTIONS, CATEGORIES, InstallOption
+from .options import (
+    OPTIONS, CATEGORIES, OPTIONS_FOR_ALL, EXCLUDED_FROM_ALL_IDS, InstallOption
+)
 
-__all__ = ["OPTIONS", "CATEGORIES", "InstallOption"]
+__all__ = [
+    "OPTIONS", "CATEGORIES", "OPTIONS_FOR_ALL", "EXCLUDED_FROM_ALL_IDS", "InstallOption"
+]
@@ -1,10 +1,10 @@
 """Installation options with metadata extracted from README.md"""
 
-from dataclasses import dataclass, field
-from typing import Optional, List
+from dataclasses import dataclass, fields
+from typing import ClassVar, Dict, FrozenSet, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InstallOption:
     """Represents a single installation option"""
     id: str
@@ -13,11 +13,17 @@ class InstallOption:
     category: str
     requires_reboot: bool = False
     excluded_from_all: bool = False
-    aliases: List[str] = field(default_factory=list)
+    aliases: Tuple[str, ...] = ()
+
+    # Names of the dataclass fields, set once below the class definition
+    FIELD_NAMES: ClassVar[FrozenSet[str]]
+
+
+InstallOption.FIELD_NAMES = frozenset(f.name for f in fields(InstallOption))
 
 
 # All available installation options
-OPTIONS: List[InstallOption] = [
+OPTIONS: Tuple[InstallOption, ...] = (
     InstallOption(
         id="claude",
         name="Claude Code",
@@ -54,7 +60,7 @@ OPTIONS: List[InstallOption] = [
         name="Hyprland Bindings",
         description="Custom key bindings and input config",
         category="Desktop",
-        aliases=["hyprland-bindings"]
+        aliases=("hyprland-bindings",)
     ),
     InstallOption(
         id="waycorner",
@@ -73,7 +79,7 @@ OPTIONS: List[InstallOption] = [
         name="SSH Key",
         description="Generate SSH key for GitHub",
         category="Security",
-        aliases=["ssh-key"]
+        aliases=("ssh-key",)
     ),
     InstallOption(
         id="passwordless-sudo",
@@ -101,7 +107,7 @@ OPTIONS: List[InstallOption] = [
         name="Noctalia Shell",
         description="Modern desktop shell (replaces Waybar)",
         category="Desktop",
-        aliases=["noctalia-shell"]
+        aliases=("noctalia-shell",)
     ),
     InstallOption(
         id="looknfeel",
@@ -109,28 +115,38 @@ OPTIONS: List[InstallOption] = [
         description="Improved Hyprland window animations",
         category="Customization"
     ),
-]
+)
 
 # Category display order
-CATEGORIES: List[str] = [
+CATEGORIES: Tuple[str, ...] = (
     "System",
     "AI Tools",
     "Shell",
     "Desktop",
     "Applications",
     "Security",
-    "Customization"
-]
+    "Customization",
+)
+
+
+# Lookup index by ID and alias, built once at import
+_BY_ID: Dict[str, InstallOption] = {opt.id: opt for opt in OPTIONS}
+_BY_ID.update({alias: opt for opt in OPTIONS for alias in opt.aliases})
+
+# Options included in and excluded from 'all' selection
+OPTIONS_FOR_ALL: Tuple[InstallOption, ...] = tuple(
+    opt for opt in OPTIONS if not opt.excluded_from_all
+)
+EXCLUDED_FROM_ALL_IDS: FrozenSet[str] = frozenset(
+    opt.id for opt in OPTIONS if opt.excluded_from_all
+)
 
 
 def get_option_by_id(option_id: str) -> Optional[InstallOption]:
-    """Get an option by its ID"""
-    for opt in OPTIONS:
-        if opt.id == option_id:
-            return opt
-    return None
+    """Get an option by its ID or alias"""
+    return _BY_ID.get(option_id)
 
 
-def get_options_for_all() -> List[InstallOption]:
+def get_options_for_all() -> Tuple[InstallOption, ...]:
     """Get options that are included in 'all' selection"""
-    return [opt for opt in OPTIONS if not opt.excluded_from_all]
+    return OPTIONS_FOR_ALL
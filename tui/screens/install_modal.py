@@ -1,17 +1,21 @@
 """Installation output modal dialog"""
 
-from typing import List
+import asyncio
+from typing import List, Optional
 from textual.screen import ModalScreen
 from textual.widgets import Static, Button, RichLog
 from textual.containers import Vertical, Horizontal
 from textual import work
 from textual.app import ComposeResult
 
-from ..utils.installer import run_installation, build_command
+from ..utils.installer import run_installation, build_command, terminate_process_tree
 
 
-class InstallModal(ModalScreen[bool]):
-    """Modal dialog showing installation output in real-time"""
+class InstallModal(ModalScreen[Optional[bool]]):
+    """Modal dialog showing installation output in real-time
+
+    Dismisses with True on success, False on failure and None if cancelled.
+    """
 
     BINDINGS = [
         ("escape", "cancel", "Cancel"),
@@ -29,21 +33,26 @@ class InstallModal(ModalScreen[bool]):
         self.uninstall = uninstall
         self.success = False
         self.completed = False
-        self.process_task = None
+        self.cancelled = False
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.command_display = " ".join(build_command(script_dir, options, uninstall))
 
     def compose(self) -> ComposeResult:
         """Compose the modal layout"""
         action = "Uninstalling" if self.uninstall else "Installing"
         options_text = ", ".join(self.options)
 
+        self._log = RichLog(id="output-log", highlight=True, markup=True)
+        self._close_btn = Button("Close", id="close-btn", variant="primary", disabled=True)
+
         yield Vertical(
             Static(
                 f"[bold magenta]{action}:[/bold magenta] [cyan]{options_text}[/cyan]",
                 id="modal-header"
             ),
-            RichLog(id="output-log", highlight=True, markup=True),
+            self._log,
             Horizontal(
-                Button("Close", id="close-btn", variant="primary", disabled=True),
+                self._close_btn,
                 id="modal-footer"
             ),
             id="modal-container"
@@ -56,32 +65,33 @@ class InstallModal(ModalScreen[bool]):
     @work(exclusive=True)
     async def run_installation_task(self) -> None:
         """Run the installation in background"""
-        log = self.query_one("#output-log", RichLog)
-        close_btn = self.query_one("#close-btn", Button)
+        log = self._log
+        close_btn = self._close_btn
 
         # Show command being run
-        cmd = build_command(self.script_dir, self.options, self.uninstall)
-        log.write(f"[dim cyan]$ {' '.join(cmd)}[/dim cyan]\n\n")
+        log.write(f"[dim cyan]$ {self.command_display}[/dim cyan]\n\n")
 
-        def output_handler(line: str) -> None:
-            """Handle output lines from the subprocess"""
-            # Convert ANSI escape codes to Rich markup where needed
-            # Most ANSI codes work directly, but we can enhance some
-            line = self._convert_ansi_to_rich(line)
-            log.write(line)
+        def output_handler_batch(lines: List[str]) -> None:
+            """Handle a batch of output lines from the subprocess"""
+            # RichLog handles the ANSI codes used by the install script natively.
+            # Each write already starts a new line, so drop the trailing newline
+            log.write("".join(lines).removesuffix("\n"))
 
         try:
             exit_code = await run_installation(
                 self.script_dir,
                 self.options,
                 self.uninstall,
-                output_handler
+                batch_callback=output_handler_batch,
+                process_callback=self._set_process
             )
 
-            self.success = exit_code == 0
+            self.success = exit_code == 0 and not self.cancelled
             self.completed = True
 
-            if self.success:
+            if self.cancelled:
+                log.write("\n[bold yellow]Installation cancelled[/bold yellow]\n")
+            elif self.success:
                 log.write("\n[bold green]Installation completed successfully![/bold green]\n")
             else:
                 log.write(f"\n[bold red]Installation failed (exit code: {exit_code})[/bold red]\n")
@@ -95,23 +105,25 @@ class InstallModal(ModalScreen[bool]):
         close_btn.disabled = False
         close_btn.focus()
 
-    def _convert_ansi_to_rich(self, text: str) -> str:
-        """Convert common ANSI codes to Rich markup for better display"""
-        # Most ANSI codes pass through, but we can enhance visibility
-        # The bash script uses these codes:
-        # RED='\033[0;31m', GREEN='\033[0;32m', YELLOW='\033[1;33m'
-        # BLUE='\033[0;34m', MAGENTA='\033[0;35m', CYAN='\033[0;36m'
-        # BOLD='\033[1m', NC='\033[0m'
-        # Rich's RichLog handles these natively, so just return as-is
-        return text
+    def _set_process(self, process: asyncio.subprocess.Process) -> None:
+        """Keep a handle on the running install process"""
+        self.process = process
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press"""
         if event.button.id == "close-btn":
-            self.dismiss(self.success)
+            self._close()
 
     def action_cancel(self) -> None:
-        """Handle escape key - only allow if completed"""
+        """Handle escape key - close if completed, otherwise stop the install"""
         if self.completed:
-            self.dismiss(self.success)
-        # If not completed, ignore escape (can't cancel mid-install easily)
+            self._close()
+        elif self.process is not None and not self.cancelled:
+            self.cancelled = True
+            self._log.write("\n[yellow]Cancelling...[/yellow]")
+            # Output keeps streaming until every process has exited
+            terminate_process_tree(self.process.pid)
+
+    def _close(self) -> None:
+        """Dismiss the modal with the installation result"""
+        self.dismiss(None if self.cancelled else self.success)
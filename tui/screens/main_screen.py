@@ -1,5 +1,7 @@
 """Main installation screen with option list"""
 
+from typing import Optional
+
 from textual.screen import Screen
 from textual.widgets import Static, Footer
 from textual.containers import Vertical, Container
@@ -8,7 +10,7 @@ from textual.binding import Binding
 
 from ..widgets.header_banner import HeaderBanner
 from ..widgets.option_list import OptionList, OptionItem
-from ..utils.state import get_installed, mark_installed, mark_uninstalled
+from ..utils.state import get_installed, mark_installed_bulk, mark_uninstalled_bulk
 from .install_modal import InstallModal
 
 
@@ -33,15 +35,18 @@ class MainScreen(Screen):
         """Compose the main screen layout"""
         installed = get_installed()
 
+        self._option_list = OptionList(installed)
+        self._status_bar = Static(
+            "[cyan]Ready[/cyan] - Select options to install",
+            id="status-bar"
+        )
+
         yield HeaderBanner()
         yield Container(
-            OptionList(installed),
+            self._option_list,
             id="option-container"
         )
-        yield Static(
-            "[cyan]Ready[/cyan] - Select options to install",
-            id="status-bar"
-        )
+        yield self._status_bar
         yield Footer()
 
     def action_quit(self) -> None:
@@ -50,7 +55,7 @@ class MainScreen(Screen):
 
     def action_toggle(self) -> None:
         """Toggle current selection"""
-        option_list = self.query_one(OptionList)
+        option_list = self._option_list
         if option_list.highlighted_child:
             item = option_list.highlighted_child
             if isinstance(item, OptionItem):
@@ -58,19 +63,15 @@ class MainScreen(Screen):
 
     def action_select_all(self) -> None:
         """Select all options (except special ones)"""
-        option_list = self.query_one(OptionList)
-        option_list.select_all(exclude_special=True)
-        self._update_status()
+        self._option_list.select_all(exclude_special=True)
 
     def action_deselect_all(self) -> None:
         """Deselect all options"""
-        option_list = self.query_one(OptionList)
-        option_list.deselect_all()
-        self._update_status()
+        self._option_list.deselect_all()
 
     def action_install(self) -> None:
         """Install selected options"""
-        option_list = self.query_one(OptionList)
+        option_list = self._option_list
         selected = option_list.get_selected_options()
 
         if not selected:
@@ -80,13 +81,15 @@ class MainScreen(Screen):
         self._set_status(f"[cyan]Installing {len(selected)} option(s)...[/cyan]")
 
         # Show installation modal
-        def on_complete(success: bool) -> None:
+        def on_complete(success: Optional[bool]) -> None:
             if success:
                 # Mark options as installed
+                mark_installed_bulk(selected)
                 for opt_id in selected:
-                    mark_installed(opt_id)
                     option_list.mark_option_installed(opt_id)
                 self._set_status(f"[green]Installed {len(selected)} option(s)[/green]")
+            elif success is None:
+                self._set_status("[yellow]Installation cancelled[/yellow]")
             else:
                 self._set_status("[red]Installation failed[/red]")
 
@@ -97,7 +100,7 @@ class MainScreen(Screen):
 
     def action_uninstall(self) -> None:
         """Uninstall selected options"""
-        option_list = self.query_one(OptionList)
+        option_list = self._option_list
         selected = option_list.get_selected_options()
 
         if not selected:
@@ -107,13 +110,15 @@ class MainScreen(Screen):
         self._set_status(f"[cyan]Uninstalling {len(selected)} option(s)...[/cyan]")
 
         # Show uninstall modal
-        def on_complete(success: bool) -> None:
+        def on_complete(success: Optional[bool]) -> None:
             if success:
                 # Mark options as uninstalled
+                mark_uninstalled_bulk(selected)
                 for opt_id in selected:
-                    mark_uninstalled(opt_id)
                     option_list.mark_option_uninstalled(opt_id)
                 self._set_status(f"[green]Uninstalled {len(selected)} option(s)[/green]")
+            elif success is None:
+                self._set_status("[yellow]Uninstall cancelled[/yellow]")
             else:
                 self._set_status("[red]Uninstall failed[/red]")
 
@@ -126,9 +131,15 @@ class MainScreen(Screen):
         """Handle option selection changes"""
         self._update_status()
 
+    def on_option_list_selection_bulk_changed(
+        self, message: OptionList.SelectionBulkChanged
+    ) -> None:
+        """Handle bulk selection changes"""
+        self._update_status()
+
     def _update_status(self) -> None:
         """Update status bar with selection count"""
-        option_list = self.query_one(OptionList)
+        option_list = self._option_list
         selected = option_list.get_selected_options()
         if selected:
             self._set_status(f"[cyan]{len(selected)} option(s) selected[/cyan]")
@@ -137,5 +148,4 @@ class MainScreen(Screen):
 
     def _set_status(self, text: str) -> None:
         """Set status bar text"""
-        status = self.query_one("#status-bar", Static)
-        status.update(text)
+        self._status_bar.update(text)
@@ -1,8 +1,12 @@
 """TUI Utilities"""
-from .state import load_state, save_state, mark_installed, mark_uninstalled, get_installed
+from .state import (
+    load_state, save_state, mark_installed, mark_uninstalled,
+    mark_installed_bulk, mark_uninstalled_bulk, get_installed
+)
 from .installer import run_installation
 
 __all__ = [
-    "load_state", "save_state", "mark_installed", "mark_uninstalled", "get_installed",
+    "load_state", "save_state", "mark_installed", "mark_uninstalled",
+    "mark_installed_bulk", "mark_uninstalled_bulk", "get_installed",
     "run_installation"
 ]
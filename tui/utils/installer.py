@@ -1,7 +1,16 @@
 """Subprocess execution for running install script"""
 
 import asyncio
-from typing import List, Callable, Optional
+import os
+import signal
+from typing import Dict, List, Callable, Optional
+
+
+# Maximum time output lines are held back before being flushed as a batch
+OUTPUT_BATCH_WINDOW = 0.016
+
+# Number of bytes requested from the process output per read
+OUTPUT_CHUNK_SIZE = 4096
 
 
 async def run_installation(
@@ -9,6 +18,8 @@ async def run_installation(
     options: List[str],
     uninstall: bool = False,
     output_callback: Optional[Callable[[str], None]] = None,
+    batch_callback: Optional[Callable[[List[str]], None]] = None,
+    process_callback: Optional[Callable[[asyncio.subprocess.Process], None]] = None,
 ) -> int:
     """
     Execute install script and stream output in real-time.
@@ -18,32 +29,62 @@ async def run_installation(
         options: List of option IDs to install/uninstall
         uninstall: If True, run in uninstall mode
         output_callback: Function to call with each output line
+        batch_callback: Function to call with batches of output lines
+            collected within OUTPUT_BATCH_WINDOW seconds
+        process_callback: Function to call with the started process, e.g. so
+            the caller can terminate it
 
     Returns:
         Exit code from the process
     """
-    # Build command
-    cmd = [f"{script_dir}/install"]
-    if uninstall:
-        cmd.append("uninstall")
-    cmd.extend(options)
-
     # Create subprocess
     process = await asyncio.create_subprocess_exec(
-        *cmd,
+        *build_command(script_dir, options, uninstall),
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.STDOUT,
         cwd=script_dir,
     )
+    if process_callback:
+        process_callback(process)
 
-    # Stream output line by line
-    while True:
-        line = await process.stdout.readline()
-        if not line:
-            break
+    loop = asyncio.get_running_loop()
+    batch: List[str] = []
+    deadline = 0.0
+    pending = b""
+
+    def emit(line: bytes) -> None:
+        nonlocal deadline
         decoded = line.decode("utf-8", errors="replace")
         if output_callback:
             output_callback(decoded)
+        if not batch:
+            deadline = loop.time() + OUTPUT_BATCH_WINDOW
+        batch.append(decoded)
+
+    def flush() -> None:
+        if batch and batch_callback:
+            batch_callback(batch.copy())
+        batch.clear()
+
+    # Stream output in chunks split into lines, flushing batches once the
+    # window elapses
+    while True:
+        timeout = max(deadline - loop.time(), 0) if batch else None
+        try:
+            chunk = await asyncio.wait_for(
+                process.stdout.read(OUTPUT_CHUNK_SIZE), timeout
+            )
+        except asyncio.TimeoutError:
+            flush()
+            continue
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            emit(line + b"\n")
+    if pending:
+        emit(pending)
+    flush()
 
     # Wait for process to complete
     await process.wait()
@@ -55,9 +96,43 @@ def build_command(
     options: List[str],
     uninstall: bool = False
 ) -> List[str]:
-    """Build the install command for display purposes"""
+    """Build the install command"""
     cmd = [f"{script_dir}/install"]
     if uninstall:
         cmd.append("uninstall")
     cmd.extend(options)
     return cmd
+
+
+def _child_pids() -> Dict[int, List[int]]:
+    """Map each parent PID to its child PIDs using /proc"""
+    children: Dict[int, List[int]] = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return children
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue  # Process exited while scanning
+        # The command name may contain spaces, so parse after its closing paren
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def terminate_process_tree(pid: int) -> None:
+    """Send SIGTERM to a process and all of its descendants"""
+    children = _child_pids()
+    pids = [pid]
+    for parent in pids:
+        pids.extend(children.get(parent, ()))
+    for target in pids:
+        try:
+            os.kill(target, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            pass  # Already exited, or running as another user (e.g. under sudo)
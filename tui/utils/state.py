@@ -1,50 +1,114 @@
 """Track installation state between runs"""
 
 import json
+import os
 from pathlib import Path
-from typing import Dict, Set
+from typing import Dict, FrozenSet, Iterable, Optional
 
 STATE_FILE = Path.home() / ".config" / "omarchy-cybex" / "installer-state.json"
 
+# Parsed state, loaded from disk once and kept in memory.
+# "installed" is held as a set and serialized as a sorted list.
+_STATE_CACHE: Optional[Dict] = None
+# Snapshot of installed IDs, rebuilt after the state changes
+_INSTALLED_FROZEN: Optional[FrozenSet[str]] = None
+# Whether the state directory has been created during this run
+_DIR_READY = False
 
-def load_state() -> Dict:
-    """Load installation state from file"""
+
+def _read_state() -> Dict:
+    """Read installation state from file"""
     if STATE_FILE.exists():
         try:
-            return json.loads(STATE_FILE.read_text())
+            state = json.loads(STATE_FILE.read_text())
         except (json.JSONDecodeError, IOError):
-            return {"installed": []}
-    return {"installed": []}
+            return {"installed": set()}
+        state["installed"] = set(state.get("installed", []))
+        return state
+    return {"installed": set()}
+
+
+def _cached_state() -> Dict:
+    """Get the in-memory state, reading the file only on first use"""
+    global _STATE_CACHE
+    if _STATE_CACHE is None:
+        _STATE_CACHE = _read_state()
+    return _STATE_CACHE
+
+
+def _write_state() -> None:
+    """Write the in-memory state to file"""
+    global _INSTALLED_FROZEN, _DIR_READY
+    _INSTALLED_FROZEN = None
+    payload = dict(_STATE_CACHE, installed=sorted(_STATE_CACHE["installed"]))
+    if not _DIR_READY:
+        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _DIR_READY = True
+    # Write to a temporary file and rename so a crash never leaves a partial file
+    tmp = STATE_FILE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(payload, separators=(",", ":")))
+    os.replace(tmp, STATE_FILE)
+
+
+def load_state() -> Dict:
+    """Load installation state from file"""
+    state = _cached_state()
+    return dict(state, installed=sorted(state["installed"]))
 
 
 def save_state(state: Dict) -> None:
     """Save installation state to file"""
-    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    STATE_FILE.write_text(json.dumps(state, indent=2))
+    global _STATE_CACHE
+    _STATE_CACHE = dict(state, installed=set(state.get("installed", ())))
+    _write_state()
 
 
 def mark_installed(option_id: str) -> None:
     """Mark an option as installed"""
-    state = load_state()
-    if option_id not in state.get("installed", []):
-        state.setdefault("installed", []).append(option_id)
-        save_state(state)
+    installed = _cached_state()["installed"]
+    if option_id not in installed:
+        installed.add(option_id)
+        _write_state()
 
 
 def mark_uninstalled(option_id: str) -> None:
     """Mark an option as uninstalled"""
-    state = load_state()
-    if option_id in state.get("installed", []):
-        state["installed"].remove(option_id)
-        save_state(state)
+    installed = _cached_state()["installed"]
+    if option_id in installed:
+        installed.discard(option_id)
+        _write_state()
+
+
+def mark_installed_bulk(option_ids: Iterable[str]) -> None:
+    """Mark several options as installed with a single write"""
+    installed = _cached_state()["installed"]
+    new_ids = set(option_ids) - installed
+    if new_ids:
+        installed |= new_ids
+        _write_state()
+
+
+def mark_uninstalled_bulk(option_ids: Iterable[str]) -> None:
+    """Mark several options as uninstalled with a single write"""
+    installed = _cached_state()["installed"]
+    removed_ids = installed & set(option_ids)
+    if removed_ids:
+        installed -= removed_ids
+        _write_state()
 
 
-def get_installed() -> Set[str]:
+def get_installed() -> FrozenSet[str]:
     """Get set of installed option IDs"""
-    return set(load_state().get("installed", []))
+    global _INSTALLED_FROZEN
+    if _INSTALLED_FROZEN is None:
+        _INSTALLED_FROZEN = frozenset(_cached_state()["installed"])
+    return _INSTALLED_FROZEN
 
 
 def clear_state() -> None:
     """Clear all installation state"""
+    global _STATE_CACHE, _INSTALLED_FROZEN
+    _STATE_CACHE = None
+    _INSTALLED_FROZEN = None
     if STATE_FILE.exists():
         STATE_FILE.unlink()
@@ -3,9 +3,13 @@
 from textual.widgets import Static
 
 
+# Maps regular spaces to non-breaking spaces
+_NBSP_TABLE = {0x20: 0xA0}
+
+
 def preserve_spaces(text: str) -> str:
     """Replace regular spaces with non-breaking spaces to preserve alignment."""
-    return text.replace(" ", "\u00a0")
+    return text.translate(_NBSP_TABLE)
 
 
 ASCII_ART = preserve_spaces("""\
@@ -19,13 +23,11 @@ Y$b,. .,,.    Q$$$$'   .$$$b.. .,d7' Q$&a,..,a&$P'  .d$$$PQ$$$b
 
 TITLE = preserve_spaces("                      C Y B E X   I N S T A L L E R")
 
+BANNER_MARKUP = f"[#cba6f7]{ASCII_ART}[/#cba6f7]\n\n[bold #f5c2e7]{TITLE}[/bold #f5c2e7]"
+
 
 class HeaderBanner(Static):
     """ASCII art header banner for the installer"""
 
     def __init__(self) -> None:
-        super().__init__(id="header-banner")
-
-    def on_mount(self) -> None:
-        content = f"[#cba6f7]{ASCII_ART}[/#cba6f7]\n\n[bold #f5c2e7]{TITLE}[/bold #f5c2e7]"
-        self.update(content)
+        super().__init__(BANNER_MARKUP, id="header-banner")
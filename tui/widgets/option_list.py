@@ -1,12 +1,25 @@
 """Option list widget with selectable items"""
 
-from typing import List, Set
+from typing import AbstractSet, List, Optional
 from textual.widgets import Static, ListView, ListItem
 from textual.reactive import reactive
 from textual.message import Message
 from textual.containers import Horizontal
 
-from ..data.options import InstallOption, OPTIONS
+from ..data.options import InstallOption, OPTIONS, OPTIONS_FOR_ALL
+
+# Display position of each option, used to keep selections in list order
+_OPTION_ORDER = {option.id: index for index, option in enumerate(OPTIONS)}
+
+# Checkbox and status indicator markup
+_CHECKBOX_ON = "[green][x][/green]"
+_CHECKBOX_OFF = "[cyan][ ][/cyan]"
+_STATUS_TEXT = {
+    "installed": "[green]OK[/green]",
+    "installing": "[yellow]...[/yellow]",
+    "failed": "[red]FAIL[/red]",
+    "pending": "",
+}
 
 
 class OptionItem(ListItem):
@@ -26,58 +39,52 @@ class OptionItem(ListItem):
         super().__init__(classes="option-item")
         self.option = option
         self._is_installed = is_installed
+        self._name_fmt = f"{option.name:<18}"
+        self._checkbox_widget: Optional[Static] = None
+        self._status_widget: Optional[Static] = None
 
     def compose(self):
         """Compose the option item layout"""
+        self._checkbox_widget = Static(self._checkbox_text(), classes="checkbox")
+        self._status_widget = Static(self._status_text(), classes=f"status --{self.status}")
         yield Horizontal(
-            Static(self._checkbox_text(), classes="checkbox"),
-            Static(f"{self.option.name:<18}", classes="option-name"),
+            self._checkbox_widget,
+            Static(self._name_fmt, classes="option-name"),
             Static(self.option.description, classes="option-desc"),
-            Static(self._status_text(), classes=f"status --{self.status}"),
+            self._status_widget,
         )
 
     def _checkbox_text(self) -> str:
         """Get checkbox display text"""
-        if self.selected:
-            return "[green][x][/green]"
-        return "[cyan][ ][/cyan]"
+        return _CHECKBOX_ON if self.selected else _CHECKBOX_OFF
 
     def _status_text(self) -> str:
         """Get status indicator text"""
-        if self.status == "installed" or self._is_installed:
-            return "[green]OK[/green]"
-        elif self.status == "installing":
-            return "[yellow]...[/yellow]"
-        elif self.status == "failed":
-            return "[red]FAIL[/red]"
-        return ""
+        if self._is_installed:
+            return _STATUS_TEXT["installed"]
+        return _STATUS_TEXT.get(self.status, "")
 
     def watch_selected(self, selected: bool) -> None:
         """Update display when selection changes"""
-        if not self.is_mounted:
+        # Keep the list's selection in step with the checkbox
+        if isinstance(self.parent, OptionList):
+            self.parent._track_selection(self.option.id, selected)
+        if self._checkbox_widget is None or not self.is_mounted:
             return
-        try:
-            checkbox = self.query_one(".checkbox", Static)
-            checkbox.update(self._checkbox_text())
-            if selected:
-                self.add_class("--highlight")
-            else:
-                self.remove_class("--highlight")
-        except Exception:
-            pass  # Widget not ready yet
+        self._checkbox_widget.update(self._checkbox_text())
+        if selected:
+            self.add_class("--highlight")
+        else:
+            self.remove_class("--highlight")
 
     def watch_status(self, status: str) -> None:
         """Update display when status changes"""
-        if not self.is_mounted:
+        if self._status_widget is None or not self.is_mounted:
             return
-        try:
-            status_widget = self.query_one(".status", Static)
-            status_widget.update(self._status_text())
-            # Update status class
-            status_widget.remove_class("--pending", "--installing", "--installed", "--failed")
-            status_widget.add_class(f"--{status}")
-        except Exception:
-            pass  # Widget not ready yet
+        self._status_widget.update(self._status_text())
+        # Update status class
+        self._status_widget.remove_class("--pending", "--installing", "--installed", "--failed")
+        self._status_widget.add_class(f"--{status}")
 
     def toggle_selection(self) -> None:
         """Toggle the selection state"""
@@ -96,39 +103,47 @@ class OptionItem(ListItem):
 class OptionList(ListView):
     """List of installation options"""
 
-    def __init__(self, installed: Set[str] = None) -> None:
+    class SelectionBulkChanged(Message):
+        """Message sent once after a bulk selection change"""
+        def __init__(self, selected_ids: AbstractSet[str]) -> None:
+            self.selected_ids = selected_ids
+            super().__init__()
+
+    def __init__(self, installed: AbstractSet[str] = None) -> None:
         super().__init__(id="option-list")
-        self.installed = installed or set()
-        self._options_map: dict[str, OptionItem] = {}
+        self.installed = installed or frozenset()
+        self._items_ordered: tuple[OptionItem, ...] = tuple(
+            OptionItem(option, option.id in self.installed) for option in OPTIONS
+        )
+        self._options_map: dict[str, OptionItem] = {
+            item.option.id: item for item in self._items_ordered
+        }
+        self._selected_ids: set[str] = set()
 
     def compose(self):
         """Compose the option list"""
-        for option in OPTIONS:
-            is_installed = option.id in self.installed
-            item = OptionItem(option, is_installed)
-            self._options_map[option.id] = item
-            yield item
+        yield from self._items_ordered
 
     def get_selected_options(self) -> List[str]:
         """Get list of selected option IDs"""
-        return [
-            opt_id for opt_id, item in self._options_map.items()
-            if item.selected
-        ]
+        return sorted(self._selected_ids, key=_OPTION_ORDER.__getitem__)
+
+    def set_selection_bulk(self, ids_to_select: AbstractSet[str]) -> None:
+        """Select exactly the given option IDs and notify once"""
+        for opt_id, item in self._options_map.items():
+            item.selected = opt_id in ids_to_select
+        self.post_message(self.SelectionBulkChanged(ids_to_select))
 
     def select_all(self, exclude_special: bool = True) -> None:
         """Select all options, optionally excluding special ones"""
-        for opt_id, item in self._options_map.items():
-            if exclude_special and item.option.excluded_from_all:
-                continue
-            if not item.selected:
-                item.toggle_selection()
+        options = OPTIONS_FOR_ALL if exclude_special else OPTIONS
+        ids = set(self._selected_ids)
+        ids.update(option.id for option in options)
+        self.set_selection_bulk(ids)
 
     def deselect_all(self) -> None:
         """Deselect all options"""
-        for item in self._options_map.values():
-            if item.selected:
-                item.toggle_selection()
+        self.set_selection_bulk(frozenset())
 
     def set_option_status(self, option_id: str, status: str) -> None:
         """Set status for a specific option"""
@@ -146,6 +161,13 @@ class OptionList(ListView):
         if option_id in self._options_map:
             self._options_map[option_id].set_installed(False)
 
+    def _track_selection(self, option_id: str, selected: bool) -> None:
+        """Record a selection change from one of the items"""
+        if selected:
+            self._selected_ids.add(option_id)
+        else:
+            self._selected_ids.discard(option_id)
+
     def on_list_item_selected(self, event: ListView.Selected) -> None:
         """Handle item selection via Enter key"""
         if isinstance(event.item, OptionItem):